@@ -3,8 +3,12 @@
 PM Agent — minimal file-backed data layer with Phase‑1 Onboarding support.
 Drop-in replacement for your existing pmagent.py.
 
+Requires: pip install orjson
+
 Data layout (relative to CWD):
   pmagent_data/
+    index.json          # {project_id: project.json contents}, backs list_projects
+    index.lock          # guards index.json read-modify-write
     projects/
       <project_id>/
         project.json
@@ -16,11 +20,21 @@ import json
 import os
 import re
 import sys
+import tempfile
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None  # type: ignore[assignment]
 
 # ----------------------------
 # Utilities
@@ -30,55 +44,131 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+# JSON codec for stored files (orjson: C parse/dump, emits bytes directly).
+# Files are machine-owned and stored compact; the CLI and st.json pretty-print for humans.
+_loads = orjson.loads
+_dumps = orjson.dumps
+
+
+_SLUG_STRIP = re.compile(r"[^a-z0-9\-\s]")
+_SLUG_WS = re.compile(r"\s+")
+_SLUG_DASH = re.compile(r"-+")
+
+
 def slugify(text: str) -> str:
     text = text.strip().lower()
-    text = re.sub(r"[^a-z0-9\-\s]", "", text)
-    text = re.sub(r"\s+", "-", text)
-    text = re.sub(r"-+", "-", text).strip("-")
+    text = _SLUG_STRIP.sub("", text)
+    text = _SLUG_WS.sub("-", text)
+    text = _SLUG_DASH.sub("-", text).strip("-")
     return text or f"project-{uuid.uuid4().hex[:6]}"
 
 
-# shallow-safe deep merge for nested dicts
+# process-wide cache of JSON files: path -> (st_ino, st_mtime_ns, st_size, parsed obj, raw bytes)
+# Every write is an os.replace, i.e. a new inode, so st_ino catches same-size rewrites that land
+# within the filesystem's mtime granularity (e.g. from the other process sharing pmagent_data).
+_JSON_CACHE: Dict[Path, Tuple[int, int, int, Any, bytes]] = {}
+
+
+def _json_cache_entry(path: Path) -> Tuple[int, int, int, Any, bytes]:
+    st = path.stat()
+    hit = _JSON_CACHE.get(path)
+    if hit is not None and hit[:3] == (st.st_ino, st.st_mtime_ns, st.st_size):
+        return hit
+    raw = path.read_bytes()
+    entry = (st.st_ino, st.st_mtime_ns, st.st_size, _loads(raw), raw)
+    _JSON_CACHE[path] = entry
+    return entry
+
+
+def _load_json_cached(path: Path) -> Any:
+    """Parse a JSON file, reusing the cached object while inode/mtime/size are unchanged.
+
+    The returned object is shared between callers — treat it as read-only.
+    """
+    return _json_cache_entry(path)[3]
+
+
+def _load_json_bytes_cached(path: Path) -> bytes:
+    """Raw bytes of a JSON file that is known to parse, served from the same cache."""
+    return _json_cache_entry(path)[4]
 
-def _deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
-    out = dict(a)
-    for k, v in b.items():
-        if isinstance(v, dict) and isinstance(out.get(k), dict):
-            out[k] = _deep_merge(out[k], v)
-        else:
-            out[k] = v
+
+def _atomic_write_json(path: Path, obj: Any) -> None:
+    # write to a private sibling temp file and rename over the target so readers never see a
+    # partial file; the unique name keeps concurrent writers from clobbering each other's temp
+    data = _dumps(obj)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            # rename keeps mtime/size, so stat the temp file rather than racing other writers on `path`
+            st = os.fstat(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    # cache a parse of what was written, never the caller's (still mutable) object
+    _JSON_CACHE[path] = (st.st_ino, st.st_mtime_ns, len(data), _loads(data), data)
+
+
+# serializes index read-modify-write between threads; the lock file covers other processes
+_INDEX_LOCK = threading.Lock()
+
+
+# deep merge for nested dicts; only dicts on the patched paths are copied,
+# so `base` (usually a shared cache entry) is never mutated
+
+def _apply_patch(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(base)
+    stack = [(out, patch)]
+    while stack:
+        dst, src = stack.pop()
+        # leaf-only level (the usual wizard patch shape): nothing to recurse into
+        if not any(isinstance(v, dict) for v in src.values()):
+            dst.update(src)
+            continue
+        for k, v in src.items():
+            cur = dst.get(k)
+            if isinstance(v, dict) and isinstance(cur, dict):
+                cur = dst[k] = dict(cur)
+                stack.append((cur, v))
+            else:
+                dst[k] = v
     return out
 
 
+def _filled(v: Any) -> bool:
+    if isinstance(v, str):
+        return bool(v.strip())
+    if isinstance(v, list):
+        return len(v) > 0
+    return v is not None
+
+
 def _compute_derived(ob: Dict[str, Any]) -> Dict[str, Any]:
-    def has(path: str) -> bool:
-        cur: Any = ob
-        for part in path.split('.'):
-            if isinstance(cur, dict) and part in cur:
-                cur = cur[part]
-            else:
-                return False
-        if isinstance(cur, str):
-            return bool(cur.strip())
-        if isinstance(cur, list):
-            return len(cur) > 0
-        return cur is not None
+    identity, intent, metrics, users, delivery, artifacts = (
+        ob.get(k) or {} for k in ("identity", "intent", "metrics", "users", "delivery", "artifacts")
+    )
 
     # coverage points (6): name, problem, direction (north star or primary metrics), users+usecases, milestones, artifacts
     points = [
-        has('identity.name'),
-        has('intent.problem_statement'),
-        has('intent.north_star') or (len(ob.get('metrics', {}).get('primary_objectives', [])) > 0),
-        (len(ob.get('users', {}).get('personas', [])) > 0) and (len(ob.get('intent', {}).get('top_use_cases', [])) > 0),
-        len(ob.get('delivery', {}).get('milestones', [])) > 0,
-        any([
-            len(ob.get('artifacts', {}).get('prds', [])) > 0,
-            len(ob.get('artifacts', {}).get('designs', [])) > 0,
-            len(ob.get('artifacts', {}).get('tech_docs', [])) > 0,
-            bool(ob.get('artifacts', {}).get('data_schema')),
-        ]),
+        _filled(identity.get("name")),
+        _filled(intent.get("problem_statement")),
+        _filled(intent.get("north_star")) or bool(metrics.get("primary_objectives")),
+        bool(users.get("personas")) and bool(intent.get("top_use_cases")),
+        bool(delivery.get("milestones")),
+        bool(
+            artifacts.get("prds")
+            or artifacts.get("designs")
+            or artifacts.get("tech_docs")
+            or artifacts.get("data_schema")
+        ),
     ]
-    covered = sum(1 for p in points if p)
+    covered = sum(points)
     ci = round(covered / len(points), 2)
 
     nba: List[str] = []
@@ -102,45 +192,116 @@ class PMAgent:
     def __init__(self, base_dir: Optional[Path] = None) -> None:
         self.base_dir: Path = Path(base_dir) if base_dir else Path(os.environ.get("PMAGENT_DATA", "./pmagent_data"))
         self.projects_dir: Path = self.base_dir / "projects"
+        self.index_path: Path = self.base_dir / "index.json"
         self.projects_dir.mkdir(parents=True, exist_ok=True)
+        # existing projects (dir + project.json) seen by this instance: project_id -> path
+        self._known_dirs: Dict[str, Path] = {}
 
     # ---- filesystem helpers ----
     def _project_dir(self, project_id: str) -> Path:
-        p = self.projects_dir / project_id
-        p.mkdir(parents=True, exist_ok=True)
+        p = self._known_dirs.get(project_id)
+        if p is None:
+            p = self.projects_dir / project_id
+            p.mkdir(parents=True, exist_ok=True)
+            # only real projects are remembered, so arbitrary ids from GET requests don't pile up
+            if (p / "project.json").exists():
+                self._known_dirs[project_id] = p
         return p
 
+    def _write_project_file(self, project_id: str, filename: str, obj: Any) -> None:
+        try:
+            _atomic_write_json(self._project_dir(project_id) / filename, obj)
+        except FileNotFoundError:
+            # project dir was removed while we had it memoized: forget it and recreate
+            self._known_dirs.pop(project_id, None)
+            _atomic_write_json(self._project_dir(project_id) / filename, obj)
+
     def _touch_project(self, project_id: str) -> None:
-        meta_path = self._project_dir(project_id) / "project.json"
-        if meta_path.exists():
-            try:
-                meta = json.loads(meta_path.read_text(encoding="utf-8"))
-            except Exception:
-                meta = {}
-        else:
+        pdir = self._project_dir(project_id)
+        try:
+            meta = dict(_load_json_cached(pdir / "project.json"))
+        except Exception:
             meta = {}
         meta.setdefault("id", project_id)
         meta["updated_at"] = now_iso()
-        meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        self._save_project_meta(project_id, meta)
 
-    # ---- project CRUD ----
-    def list_projects(self) -> List[Dict[str, Any]]:
-        out: List[Dict[str, Any]] = []
-        for p in sorted(self.projects_dir.glob("*/project.json")):
+    def _save_project_meta(self, project_id: str, meta: Dict[str, Any]) -> None:
+        self._write_project_file(project_id, "project.json", meta)
+        self._save_index_entry(project_id, meta)
+
+    # ---- project index ----
+    def _project_names(self) -> Set[str]:
+        # real, non-hidden subdirectories only (skips .DS_Store, .git, symlinked dirs, stray files)
+        with os.scandir(self.projects_dir) as it:
+            return {e.name for e in it if not e.name.startswith(".") and e.is_dir(follow_symlinks=False)}
+
+    def _scan_projects(self) -> Dict[str, Dict[str, Any]]:
+        index: Dict[str, Dict[str, Any]] = {}
+        for name in self._project_names():
             try:
-                meta = json.loads(p.read_text(encoding="utf-8"))
-                meta.setdefault("id", p.parent.name)
-                out.append(meta)
+                meta = dict(_load_json_cached(self.projects_dir / name / "project.json"))
+                meta.setdefault("id", name)
+                index[name] = meta
             except Exception:
-                # skip broken files
+                # skip broken or missing files
                 continue
-        # sort by updated_at desc, fallback name asc
-        def sort_key(m: Dict[str, Any]):
-            return (
-                0 - datetime.fromisoformat(m.get("updated_at", "1970-01-01T00:00:00+00:00").replace("Z", "+00:00")).timestamp(),
-                m.get("name", ""),
-            )
-        out.sort(key=sort_key)
+        return index
+
+    @contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        with _INDEX_LOCK, open(self.base_dir / "index.lock", "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def _read_index(self, adding: Optional[str] = None) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Current index, or None when it is missing, corrupt or out of step with projects_dir."""
+        try:
+            index = _load_json_cached(self.index_path)
+        except Exception:
+            return None
+        if not isinstance(index, dict):
+            return None
+        names = self._project_names()
+        # directories removed behind our back, or projects written without an index update
+        if not names.issuperset(index):
+            return None
+        unindexed = names.difference(index)
+        unindexed.discard(adding)  # the entry the caller is about to write
+        if any((self.projects_dir / n / "project.json").exists() for n in unindexed):
+            return None
+        return index
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        index = self._read_index()
+        if index is not None:
+            return index
+        with self._index_lock():
+            index = self._read_index()
+            if index is None:
+                index = self._scan_projects()
+                _atomic_write_json(self.index_path, index)
+        return index
+
+    def _save_index_entry(self, project_id: str, meta: Dict[str, Any]) -> None:
+        entry = dict(meta)
+        entry.setdefault("id", project_id)
+        with self._index_lock():
+            index = self._read_index(adding=project_id)
+            # a rescan already picks up the project.json just written
+            index = self._scan_projects() if index is None else dict(index)
+            index[project_id] = entry
+            _atomic_write_json(self.index_path, index)
+
+    # ---- project CRUD ----
+    def list_projects(self) -> List[Dict[str, Any]]:
+        # copies: the index dicts live in the shared JSON cache
+        out: List[Dict[str, Any]] = [dict(m) for m in self._load_index().values()]
+        # sort by updated_at desc, fallback name asc; now_iso() timestamps are all
+        # UTC with the same layout, so they order correctly as plain strings
+        out.sort(key=lambda m: m.get("name", ""))
+        out.sort(key=lambda m: m.get("updated_at", ""), reverse=True)
         return out
 
     def create_project(self, name: str, description: str = "") -> Dict[str, Any]:
@@ -151,17 +312,18 @@ class PMAgent:
         suffix = uuid.uuid4().hex[:6]
         project_id = f"{base}-{suffix}"
         pdir = self._project_dir(project_id)
+        ts = now_iso()
         meta = {
             "id": project_id,
             "name": name.strip(),
             "description": description.strip() if description else "",
-            "created_at": now_iso(),
-            "updated_at": now_iso(),
+            "created_at": ts,
+            "updated_at": ts,
         }
-        (pdir / "project.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        self._save_project_meta(project_id, meta)
         # initialize empty onboarding draft
         if not (pdir / "onboarding.json").exists():
-            (pdir / "onboarding.json").write_text(json.dumps(self._empty_onboarding(), indent=2), encoding="utf-8")
+            self._write_project_file(project_id, "onboarding.json", self._empty_onboarding())
         return meta
 
     # ---- onboarding ----
@@ -177,61 +339,89 @@ class PMAgent:
             "derived": {"next_best_actions": [], "confidence_index": 0.0},
         }
 
+    def _shared_onboarding(self, project_id: str) -> Dict[str, Any]:
+        # the shared JSON cache entry itself — internal, read-only use only
+        pdir = self._project_dir(project_id)
+        try:
+            return _load_json_cached(pdir / "onboarding.json")
+        except Exception:
+            return self._empty_onboarding()
+
     def get_onboarding(self, project_id: str) -> Dict[str, Any]:
+        # private copy, parsed from the cached bytes (cheap with orjson)
         pdir = self._project_dir(project_id)
-        path = pdir / "onboarding.json"
-        if path.exists():
-            try:
-                return json.loads(path.read_text(encoding="utf-8"))
-            except Exception:
-                return self._empty_onboarding()
-        return self._empty_onboarding()
+        try:
+            return _loads(_load_json_bytes_cached(pdir / "onboarding.json"))
+        except Exception:
+            return self._empty_onboarding()
 
-    def save_onboarding_draft(self, project_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
+    def get_onboarding_json(self, project_id: str) -> bytes:
+        """Onboarding draft as already-serialized JSON, for passing straight through HTTP."""
         pdir = self._project_dir(project_id)
-        existing = self.get_onboarding(project_id)
-        merged = _deep_merge(existing, patch)
+        try:
+            return _load_json_bytes_cached(pdir / "onboarding.json")
+        except Exception:
+            return _EMPTY_ONBOARDING_JSON
+
+    def save_onboarding_draft(self, project_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
+        if not patch:
+            return self.get_onboarding(project_id)
+        existing = self._shared_onboarding(project_id)
+        merged = _apply_patch(existing, patch)
         # update derived on every draft save
         merged["derived"] = _compute_derived(merged)
-        (pdir / "onboarding.json").write_text(json.dumps(merged, indent=2), encoding="utf-8")
+        # nothing changed (e.g. "Save draft" without edits): skip both writes
+        if merged == existing:
+            return self.get_onboarding(project_id)
+        self._write_project_file(project_id, "onboarding.json", merged)
         self._touch_project(project_id)
+        # safe to hand out: the write replaced the cache entry whose subtrees `merged` shares
         return merged
 
     def commit_onboarding(self, project_id: str) -> Dict[str, Any]:
         pdir = self._project_dir(project_id)
         ob = self.get_onboarding(project_id)
+        identity = ob.get("identity") or {}
+        intent = ob.get("intent") or {}
         # Validate required fields
         missing: List[str] = []
-        if not ob.get("identity", {}).get("name", "").strip():
+        if not _filled(identity.get("name")):
             missing.append("identity.name")
-        if not ob.get("intent", {}).get("problem_statement", "").strip():
+        if not _filled(intent.get("problem_statement")):
             missing.append("intent.problem_statement")
         if missing:
             raise ValueError("Missing required: " + ", ".join(missing))
 
-        # Recompute derived
-        ob["derived"] = _compute_derived(ob)
-        (pdir / "onboarding.json").write_text(json.dumps(ob, indent=2), encoding="utf-8")
+        # Recompute derived; drafts saved through save_onboarding_draft are already current
+        derived = _compute_derived(ob)
+        if derived != ob.get("derived"):
+            ob["derived"] = derived
+            self._write_project_file(project_id, "onboarding.json", ob)
 
         # sync summary fields to project.json for list views
-        meta_path = pdir / "project.json"
         try:
-            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta = dict(_load_json_cached(pdir / "project.json"))
         except Exception:
             meta = {"id": project_id}
-        meta["name"] = ob.get("identity", {}).get("name") or meta.get("name")
+        meta.setdefault("id", project_id)
+        meta["name"] = identity.get("name") or meta.get("name")
         # prefer one_line, then north_star, else existing description
         summary = (
-            ob.get("identity", {}).get("one_line")
-            or ob.get("intent", {}).get("north_star")
+            identity.get("one_line")
+            or intent.get("north_star")
             or meta.get("description", "")
         )
         meta["description"] = summary
         meta["updated_at"] = now_iso()
-        meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        self._save_project_meta(project_id, meta)
         return ob
 
 
+# The empty draft stays a dict literal: rebuilding it is cheaper than deepcopy or
+# re-parsing a template. Only its serialized form (served as-is over HTTP) is cached.
+_EMPTY_ONBOARDING_JSON: bytes = _dumps(PMAgent._empty_onboarding())
+
+
 # ----------------------------
 # Optional CLI for quick ops
 # ----------------------------
@@ -270,7 +460,7 @@ def _main(argv: List[str]) -> int:
             return 0
         if cmd == "onb-save":
             project_id = argv[2]
-            patch = json.loads(argv[3]) if len(argv) > 3 else {}
+            patch = _loads(argv[3]) if len(argv) > 3 else {}
             print(json.dumps(ag.save_onboarding_draft(project_id, patch), indent=2))
             return 0
         if cmd == "onb-commit":
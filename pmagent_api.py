@@ -2,14 +2,15 @@
 """
 FastAPI wrapper for pmagent.py
 Run:
-  pip install fastapi "uvicorn[standard]" pydantic
+  pip install fastapi "uvicorn[standard]" pydantic orjson
   python -m uvicorn pmagent_api:app --reload  # http://localhost:8000
 """
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any, Dict, Optional
 
-from fastapi import Body, FastAPI, HTTPException
+from fastapi import Body, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
@@ -29,6 +30,22 @@ app.add_middleware(
 agent = PMAgent()
 
 
+def _file_etag(path: Path) -> Optional[str]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _cache_headers(etag: Optional[str]) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "no-cache"} if etag else {}
+
+
+def _not_modified(request: Request, etag: Optional[str]) -> bool:
+    return etag is not None and request.headers.get("if-none-match") == etag
+
+
 class CreateProjectRequest(BaseModel):
     name: str
     description: Optional[str] = ""
@@ -40,8 +57,15 @@ def health() -> Dict[str, str]:
 
 
 @app.get("/projects")
-def list_projects():
-    return agent.list_projects()
+def list_projects(request: Request, response: Response):
+    # list first: it reconciles a stale index.json, so the ETag below matches the body
+    projects = agent.list_projects()
+    etag = _file_etag(agent.index_path)
+    headers = _cache_headers(etag)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return projects
 
 
 @app.post("/projects")
@@ -52,8 +76,13 @@ def create_project(req: CreateProjectRequest):
 
 
 @app.get("/projects/{project_id}/onboarding")
-def get_onboarding(project_id: str):
-    return agent.get_onboarding(project_id)
+def get_onboarding(project_id: str, request: Request):
+    etag = _file_etag(agent.projects_dir / project_id / "onboarding.json")
+    headers = _cache_headers(etag)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    # stored bytes are passed through as-is; no parse/re-serialize round-trip
+    return Response(content=agent.get_onboarding_json(project_id), media_type="application/json", headers=headers)
 
 
 @app.patch("/projects/{project_id}/onboarding")
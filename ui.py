@@ -3,13 +3,12 @@
 Copy-pasteable full app. Requires pmagent.py in the same folder.
 
 Run:
-  pip install streamlit "pydantic>=1.10,<3"
+  pip install streamlit "pydantic>=1.10,<3" orjson
   streamlit run ui.py
 """
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import os
 from typing import Any, Dict, List
 
 import streamlit as st
@@ -34,18 +33,53 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# Ensure agent singleton
-if "agent" not in st.session_state:
-    st.session_state["agent"] = PMAgent()
+# Agent singleton shared by all sessions (PMAgent only wraps the filesystem)
+@st.cache_resource
+def _agent() -> PMAgent:
+    return PMAgent()
+
+
+ag: PMAgent = _agent()
+
+
+# Cached reads — reruns happen on every widget interaction, so keep disk reads off that path.
+# Keys include file mtimes so edits from other sessions/the API are picked up; writes below clear explicitly.
+def _mtime(path: os.PathLike) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_projects(index_mtime: int) -> List[Dict[str, Any]]:
+    return ag.list_projects()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_onboarding(project_id: str, onboarding_mtime: int) -> Dict[str, Any]:
+    return ag.get_onboarding(project_id)
+
+
+def list_projects() -> List[Dict[str, Any]]:
+    return _cached_projects(_mtime(ag.index_path))
+
+
+def get_onboarding(project_id: str) -> Dict[str, Any]:
+    return _cached_onboarding(project_id, _mtime(ag.projects_dir / project_id / "onboarding.json"))
+
+
+def _clear_cached_reads() -> None:
+    _cached_projects.clear()
+    _cached_onboarding.clear()
 
-ag: PMAgent = st.session_state["agent"]
 
 # ----------------------------
 # Sidebar — project picker / creator
 # ----------------------------
 with st.sidebar:
     st.header("Projects")
-    projects = ag.list_projects()
+    projects = list_projects()
     if projects:
         labels = [f"{p.get('name','<unnamed>')} — {p['id']}" for p in projects]
         ids = [p["id"] for p in projects]
@@ -63,6 +97,7 @@ with st.sidebar:
     if st.button("Create Project", use_container_width=True, type="primary"):
         try:
             meta = ag.create_project(new_name, new_desc)
+            _cached_projects.clear()
             st.success(f"Created {meta['name']}")
             selected_project = meta["id"]
             st.rerun()
@@ -90,6 +125,17 @@ def _list_to_lines(items: List[str]) -> str:
     return "\n".join(items or [])
 
 
+def _deep_merge_inplace(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    stack = [(dst, src)]
+    while stack:
+        d, s = stack.pop()
+        for k, v in s.items():
+            if isinstance(v, dict) and isinstance(d.get(k), dict):
+                stack.append((d[k], v))
+            else:
+                d[k] = v
+
+
 # ----------------------------
 # Main content
 # ----------------------------
@@ -100,13 +146,12 @@ if not selected_project:
     st.info("Select or create a project from the sidebar to begin.")
     st.stop()
 
-# Load metadata
-proj_dir = Path("pmagent_data") / "projects" / selected_project
-meta_path = proj_dir / "project.json"
-if meta_path.exists():
-    meta = json.loads(meta_path.read_text(encoding="utf-8"))
-else:
-    meta = {"id": selected_project}
+def _project_meta(project_id: str) -> Dict[str, Any]:
+    # served from the cached listing; no need to re-read project.json
+    return next((p for p in list_projects() if p["id"] == project_id), {"id": project_id})
+
+
+meta = _project_meta(selected_project)
 
 # Tabs
 onb_tab, project_tab = st.tabs(["Onboarding", "Project"])  # add more later (Chat, Experiments)
@@ -117,7 +162,14 @@ onb_tab, project_tab = st.tabs(["Onboarding", "Project"])  # add more later (Cha
 with onb_tab:
     st.subheader("Phase‑1 Onboarding")
 
-    ob = ag.get_onboarding(selected_project)
+    # wizard edits are buffered per project and written on step changes / explicit saves
+    pending_key = f"pending::{selected_project}"
+    pending_count_key = f"pending_count::{selected_project}"
+
+    ob = get_onboarding(selected_project)
+    if st.session_state.get(pending_key):
+        # show unsaved edits on top of the stored draft (cache_data hands back a private copy)
+        _deep_merge_inplace(ob, st.session_state[pending_key])
 
     # per-project step state
     step_key = f"onb_step::{selected_project}"
@@ -127,9 +179,23 @@ with onb_tab:
 
     st.progress(step / 6)
     st.caption(f"Step {step} of 6")
-
-    def save_patch(patch: Dict[str, Any]) -> Dict[str, Any]:
+    unsaved = st.session_state.get(pending_count_key, 0)
+    if unsaved:
+        st.caption(f"{unsaved} unsaved change{'s' if unsaved != 1 else ''} — saved when you switch steps or commit.")
+
+    def _stage(patch: Dict[str, Any]) -> None:
+        _deep_merge_inplace(st.session_state.setdefault(pending_key, {}), patch)
+        st.session_state[pending_count_key] = st.session_state.get(pending_count_key, 0) + 1
+
+    def _flush() -> Dict[str, Any]:
+        patch = st.session_state.get(pending_key)
+        if not patch:
+            return ob
         saved = ag.save_onboarding_draft(selected_project, patch)
+        # drop the buffer only once it is on disk, so a failed save keeps the staged edits
+        st.session_state.pop(pending_key, None)
+        st.session_state.pop(pending_count_key, None)
+        _clear_cached_reads()
         return saved
 
     # Step 1 — Basics (required)
@@ -146,13 +212,15 @@ with onb_tab:
             )
         cols = st.columns(2)
         if cols[0].button("Save draft", use_container_width=True):
-            save_patch({"identity": {"name": name, "one_line": one_line}, "intent": {"problem_statement": problem}})
+            _stage({"identity": {"name": name, "one_line": one_line}, "intent": {"problem_statement": problem}})
+            _flush()
             st.success("Draft saved.")
         if cols[1].button("Save & Continue →", use_container_width=True, type="primary"):
             if not name.strip() or not problem.strip():
                 st.error("Name and Problem Statement are required.")
             else:
-                save_patch({"identity": {"name": name, "one_line": one_line}, "intent": {"problem_statement": problem}})
+                _stage({"identity": {"name": name, "one_line": one_line}, "intent": {"problem_statement": problem}})
+                _flush()
                 st.session_state[step_key] = 2
                 st.rerun()
 
@@ -164,17 +232,17 @@ with onb_tab:
         oos = st.text_area("Out of Scope (one per line)", value=_list_to_lines(ob.get("intent", {}).get("out_of_scope", [])))
         cols = st.columns(2)
         if cols[0].button("← Back"):
-            st.session_state[step_key] = 1; st.rerun()
+            _flush(); st.session_state[step_key] = 1; st.rerun()
         if cols[1].button("Save & Continue →", type="primary"):
             bo_list = _csv_to_list(bos)
             oo_list = _lines_to_list(oos)
-            save_patch({"intent": {"north_star": ns, "business_objectives": bo_list, "out_of_scope": oo_list}})
-            st.session_state[step_key] = 3; st.rerun()
+            _stage({"intent": {"north_star": ns, "business_objectives": bo_list, "out_of_scope": oo_list}})
+            _flush(); st.session_state[step_key] = 3; st.rerun()
 
     # Step 3 — Users & Use Cases
     if step == 3:
         st.markdown("### 3) Users & Use Cases")
-        personas: List[Dict[str, Any]] = ob.get("users", {}).get("personas", [])
+        personas: List[Dict[str, Any]] = list(ob.get("users", {}).get("personas", []))
         st.markdown("**Personas**")
         if personas:
             for i, p in enumerate(personas):
@@ -183,15 +251,15 @@ with onb_tab:
         cols = st.columns(3)
         if cols[0].button("Add Persona") and new_p.strip():
             personas.append({"name": new_p.strip()})
-            save_patch({"users": {"personas": personas}})
+            _stage({"users": {"personas": personas}})
             st.rerun()
         if cols[1].button("← Back"):
-            st.session_state[step_key] = 2; st.rerun()
+            _flush(); st.session_state[step_key] = 2; st.rerun()
         if cols[2].button("Continue →", type="primary"):
-            st.session_state[step_key] = 4; st.rerun()
+            _flush(); st.session_state[step_key] = 4; st.rerun()
 
         st.markdown("---")
-        tuc: List[Dict[str, Any]] = ob.get("intent", {}).get("top_use_cases", [])
+        tuc: List[Dict[str, Any]] = list(ob.get("intent", {}).get("top_use_cases", []))
         st.markdown("**Top Use Cases**")
         if tuc:
             for uc in tuc:
@@ -201,14 +269,14 @@ with onb_tab:
         sc = st.text_area("Success criteria (one per line)")
         if st.button("Add Use Case") and title.strip():
             tuc.append({"title": title.strip(), "success_criteria": _lines_to_list(sc)})
-            save_patch({"intent": {"top_use_cases": tuc}})
+            _stage({"intent": {"top_use_cases": tuc}})
             st.rerun()
 
     # Step 4 — Metrics
     if step == 4:
         st.markdown("### 4) Metrics — Primary Objectives & Guardrails")
-        po: List[Dict[str, Any]] = ob.get("metrics", {}).get("primary_objectives", [])
-        gr: List[Dict[str, Any]] = ob.get("metrics", {}).get("guardrails", [])
+        po: List[Dict[str, Any]] = list(ob.get("metrics", {}).get("primary_objectives", []))
+        gr: List[Dict[str, Any]] = list(ob.get("metrics", {}).get("guardrails", []))
 
         st.markdown("**Primary Objectives**")
         if po:
@@ -233,7 +301,7 @@ with onb_tab:
                     "target": to_float(target),
                     "target_date": tdate.strip() or None,
                 })
-                save_patch({"metrics": {"primary_objectives": po}})
+                _stage({"metrics": {"primary_objectives": po}})
                 st.rerun()
 
         st.markdown("**Guardrails**")
@@ -257,19 +325,19 @@ with onb_tab:
                     "threshold": to_float(gthr),
                     "direction": gdir,
                 })
-                save_patch({"metrics": {"guardrails": gr}})
+                _stage({"metrics": {"guardrails": gr}})
                 st.rerun()
 
         cols = st.columns(2)
         if cols[0].button("← Back"):
-            st.session_state[step_key] = 3; st.rerun()
+            _flush(); st.session_state[step_key] = 3; st.rerun()
         if cols[1].button("Continue →", type="primary"):
-            st.session_state[step_key] = 5; st.rerun()
+            _flush(); st.session_state[step_key] = 5; st.rerun()
 
     # Step 5 — Milestones
     if step == 5:
         st.markdown("### 5) Milestones")
-        ms: List[Dict[str, Any]] = ob.get("delivery", {}).get("milestones", [])
+        ms: List[Dict[str, Any]] = list(ob.get("delivery", {}).get("milestones", []))
         if ms:
             for m in ms:
                 st.write(f"• {m.get('name')} — {m.get('date') or 'no date'}")
@@ -279,12 +347,12 @@ with onb_tab:
         cols = st.columns(3)
         if cols[0].button("Add Milestone") and name.strip():
             ms.append({"name": name.strip(), "date": date.strip() or None, "exit_criteria": _lines_to_list(ec)})
-            save_patch({"delivery": {"milestones": ms}})
+            _stage({"delivery": {"milestones": ms}})
             st.rerun()
         if cols[1].button("← Back"):
-            st.session_state[step_key] = 4; st.rerun()
+            _flush(); st.session_state[step_key] = 4; st.rerun()
         if cols[2].button("Continue →", type="primary"):
-            st.session_state[step_key] = 6; st.rerun()
+            _flush(); st.session_state[step_key] = 6; st.rerun()
 
     # Step 6 — Artifacts + Review
     if step == 6:
@@ -305,7 +373,8 @@ with onb_tab:
                     "data_schema": None if ds_type == "none" else {"type": ds_type, "value": ds_val.strip()},
                 }
             }
-            ob = save_patch(payload)
+            _stage(payload)
+            ob = _flush()
             st.success("Artifacts saved.")
 
         st.markdown("---")
@@ -319,10 +388,14 @@ with onb_tab:
 
         cols = st.columns(3)
         if cols[0].button("← Back"):
-            st.session_state[step_key] = 5; st.rerun()
+            _flush(); st.session_state[step_key] = 5; st.rerun()
         if cols[2].button("✅ Commit Onboarding", type="primary"):
             try:
+                _flush()
                 final = ag.commit_onboarding(selected_project)
+                _clear_cached_reads()
+                # commit syncs name/description into project.json; refresh for the Project tab
+                meta = _project_meta(selected_project)
                 st.success("Onboarding committed! You can navigate away or continue editing.")
             except Exception as e:
                 st.error(str(e))
@@ -335,15 +408,10 @@ with project_tab:
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("**project.json**")
-        try:
-            st.json(json.loads((proj_dir / "project.json").read_text(encoding="utf-8")))
-        except Exception:
-            st.write("(missing)")
+        st.json(meta)
     with col2:
         st.markdown("**onboarding.json**")
-        try:
-            st.json(json.loads((proj_dir / "onboarding.json").read_text(encoding="utf-8")))
-        except Exception:
-            st.write("(missing)")
+        # stored draft only — `ob` may carry staged, not-yet-written wizard edits
+        st.json(get_onboarding(selected_project))
 
     st.caption("Files are stored under ./pmagent_data/projects/<project_id>/ …")